@@ -2,15 +2,46 @@
 # A comprehensive currency converter with GUI, CLI, and API integration
 
 import requests
+from requests.adapters import HTTPAdapter
+from urllib3.util.retry import Retry
 import tkinter as tk
 from tkinter import ttk, messagebox
 import sqlite3
-from datetime import datetime, timedelta
+from datetime import datetime
 import argparse
 import sys
-from typing import Dict, List, Optional, Tuple
+from typing import Dict, List, Mapping, Optional, Tuple
 from dataclasses import dataclass
+from types import MappingProxyType
+from concurrent.futures import ThreadPoolExecutor, as_completed
 import logging
+import asyncio
+import functools
+import time
+import threading
+import queue
+import weakref
+
+try:
+    import httpx
+except ImportError:  # async fetching falls back to the blocking client
+    httpx = None
+
+try:
+    import numpy as np
+except ImportError:  # only needed for bulk conversion
+    np = None
+
+try:
+    import orjson
+except ImportError:  # JSON decoding falls back to the stdlib parser
+    orjson = None
+
+try:
+    import h2  # noqa: F401
+    _HTTP2_AVAILABLE = True
+except ImportError:
+    _HTTP2_AVAILABLE = False
 
 # Configure logging
 logging.basicConfig(
@@ -19,6 +50,39 @@ logging.basicConfig(
 )
 logger = logging.getLogger(__name__)
 
+# Fallback exchange rates (USD base) when APIs are unavailable
+_FALLBACK_RATES = MappingProxyType({
+    "USD": 1.0, "EUR": 0.85, "GBP": 0.73, "JPY": 110.0,
+    "AUD": 1.35, "CAD": 1.25, "CHF": 0.92, "CNY": 6.45,
+    "ZAR": 15.5, "INR": 74.5, "BRL": 5.2, "RUB": 73.5,
+    "KRW": 1180.0, "SGD": 1.35, "HKD": 7.8, "MXN": 20.5,
+    "SEK": 8.6, "NOK": 8.9, "DKK": 6.4, "PLN": 3.9,
+    "TRY": 8.5, "CZK": 22.0, "HUF": 300.0, "RON": 4.2
+})
+
+@functools.cache
+def _cross_rate(from_currency: str, to_currency: str) -> float:
+    """Fallback rate between two currencies, computed once per pair"""
+    return _FALLBACK_RATES[to_currency] / _FALLBACK_RATES[from_currency]
+
+@functools.cache
+def _rebased_fallback_rates(base_currency: str) -> Mapping[str, float]:
+    """Fallback rates rebased on base_currency, built once per base"""
+    return MappingProxyType({currency: _cross_rate(base_currency, currency)
+                             for currency in _FALLBACK_RATES})
+
+def _decode_json(response) -> Dict:
+    """Decode an HTTP response body, using orjson when available"""
+    if orjson is not None:
+        return orjson.loads(response.content)
+    return response.json()
+
+def _normalize_code(code: str) -> str:
+    """Canonical, interned form of a currency code"""
+    # strip() returns the same object when there is nothing to strip, so
+    # this allocates at most once; interning makes later comparisons cheap
+    return sys.intern(code.strip().upper())
+
 @dataclass
 class ExchangeRate:
     """Data class for exchange rate information"""
@@ -40,36 +104,107 @@ class CurrencyAPI:
         ]
         # Premium API with key
         self.premium_api = "https://v6.exchangerate-api.com/v6/"
+        # Shared session so repeated requests reuse keep-alive connections
+        self.session = requests.Session()
+        adapter = HTTPAdapter(
+            pool_connections=4,
+            pool_maxsize=8,
+            max_retries=Retry(total=2, backoff_factor=0.3)
+        )
+        self.session.mount("https://", adapter)
+        # Per-instance memo of fetched rates, keyed by (base_currency, bucket)
+        self._fetch_rates_raw = functools.lru_cache(maxsize=32)(self._fetch_rates)
 
     def get_exchange_rates(self, base_currency: str = "USD") -> Dict[str, float]:
-        """Fetch current exchange rates"""
-
-        # Try premium API first if we have a key
-        if self.api_key:
-            try:
-                return self._fetch_premium_rates(base_currency)
-            except Exception as e:
-                logger.warning(f"Premium API failed: {e}, trying free APIs")
-
-        # Try free APIs
-        for api_url in self.free_apis:
-            try:
-                return self._fetch_free_rates(api_url, base_currency)
-            except Exception as e:
-                logger.warning(f"API {api_url} failed: {e}")
-                continue
-
-        # If all APIs fail, use fallback rates
-        logger.error("All APIs failed, using fallback rates")
-        return self._get_fallback_rates()
+        """Fetch current exchange rates
+
+        Falls back to built-in rates when every API fails, and raises if
+        there are no built-in rates for base_currency either.
+        """
+        base_currency = _normalize_code(base_currency)
+        # Rates are memoized per base currency for the same 1-hour window
+        # used by the database cache
+        bucket = int(time.time() // 3600)
+        try:
+            return dict(self._fetch_rates_raw(base_currency, bucket))
+        except Exception:
+            # If all APIs fail, use fallback rates (never memoized)
+            return self._get_fallback_rates(base_currency)
+
+    def get_rate(self, from_currency: str, to_currency: str) -> float:
+        """Get the exchange rate from one currency to another"""
+        from_currency = _normalize_code(from_currency)
+        to_currency = _normalize_code(to_currency)
+        bucket = int(time.time() // 3600)
+        try:
+            rates = self._fetch_rates_raw(from_currency, bucket)
+        except Exception:
+            # Fallback rates are USD-based, so derive the cross rate
+            if from_currency not in _FALLBACK_RATES or to_currency not in _FALLBACK_RATES:
+                raise Exception(
+                    f"All APIs failed and no fallback rate is available for "
+                    f"{from_currency} to {to_currency}"
+                )
+            logger.error("All APIs failed, using fallback rates")
+            return _cross_rate(from_currency, to_currency)
+        if to_currency not in rates:
+            raise Exception(f"No exchange rate available for {to_currency}")
+        return rates[to_currency]
+
+    def convert_bulk(self, amounts, from_currency: str, to_currency: str):
+        """Convert many amounts at once.
+
+        ``amounts`` is expected to be a ``np.ndarray`` (any array-like is
+        accepted); the rate is fetched once and applied as a single
+        vectorized multiply.
+        """
+        if np is None:
+            raise Exception("numpy is required for bulk conversion")
+        rate = self.get_rate(from_currency, to_currency)
+        return np.asarray(amounts, dtype=np.float64) * rate
+
+    def cache_clear(self):
+        """Clear the in-memory exchange rate cache"""
+        self._fetch_rates_raw.cache_clear()
+
+    def _fetch_rates(self, base_currency: str, bucket: int) -> Dict[str, float]:
+        """Fetch rates from the APIs, raising if every source fails"""
+
+        # Race the premium API (if we have a key) against the free APIs and
+        # take the first successful answer
+        executor = ThreadPoolExecutor(max_workers=len(self.free_apis) + 1)
+        try:
+            futures = {}
+            if self.api_key:
+                futures[executor.submit(self._fetch_premium_rates, base_currency)] = "premium"
+            futures.update({
+                executor.submit(self._fetch_free_rates, api_url, base_currency): api_url
+                for api_url in self.free_apis
+            })
+            for future in as_completed(futures):
+                try:
+                    rates = future.result()
+                except Exception as e:
+                    logger.warning(f"API {futures[future]} failed: {e}")
+                    continue
+                for other in futures:
+                    if other is not future and not other.done():
+                        other.cancel()
+                        logger.debug(f"Using {futures[future]}, abandoning {futures[other]}")
+                return rates
+        finally:
+            # Don't wait on slower APIs once we have an answer
+            executor.shutdown(wait=False, cancel_futures=True)
+
+        raise Exception(f"No exchange rate API available for {base_currency}")
 
     def _fetch_premium_rates(self, base_currency: str) -> Dict[str, float]:
         """Fetch from premium API with key"""
         url = f"{self.premium_api}{self.api_key}/latest/{base_currency}"
-        response = requests.get(url, timeout=10)
+        response = self.session.get(url, timeout=10)
         response.raise_for_status()
 
-        data = response.json()
+        data = _decode_json(response)
         if data.get("result") == "success":
             return data["conversion_rates"]
         else:
@@ -78,11 +213,15 @@ class CurrencyAPI:
     def _fetch_free_rates(self, api_url: str, base_currency: str) -> Dict[str, float]:
         """Fetch from free API"""
         url = f"{api_url}{base_currency}"
-        response = requests.get(url, timeout=10)
+        response = self.session.get(url, timeout=10)
         response.raise_for_status()
 
-        data = response.json()
+        data = _decode_json(response)
+        return self._extract_rates(data)
 
+    @staticmethod
+    def _extract_rates(data: Dict) -> Dict[str, float]:
+        """Pull the rates mapping out of a free API response"""
         # Handle different API response formats
         if "rates" in data:
             return data["rates"]
@@ -91,126 +230,385 @@ class CurrencyAPI:
         else:
             raise Exception("Unexpected API response format")
 
-    def _get_fallback_rates(self) -> Dict[str, float]:
+    async def _afetch(self, client, url: str) -> Dict:
+        """Fetch and decode a JSON payload asynchronously"""
+        response = await client.get(url, timeout=10)
+        response.raise_for_status()
+        return _decode_json(response)
+
+    async def aget_exchange_rates(self, base_currency: str = "USD") -> Dict[str, float]:
+        """Fetch current exchange rates from all free APIs concurrently"""
+        base_currency = _normalize_code(base_currency)
+        if httpx is None:
+            # Without httpx, run the blocking fetch off the event loop
+            return await asyncio.to_thread(self.get_exchange_rates, base_currency)
+
+        async with httpx.AsyncClient(http2=_HTTP2_AVAILABLE) as client:
+            results = await asyncio.gather(
+                *[self._afetch(client, f"{api_url}{base_currency}")
+                  for api_url in self.free_apis],
+                return_exceptions=True
+            )
+
+        for api_url, result in zip(self.free_apis, results):
+            if isinstance(result, Exception):
+                logger.warning(f"API {api_url} failed: {result}")
+                continue
+            try:
+                return self._extract_rates(result)
+            except Exception as e:
+                logger.warning(f"API {api_url} failed: {e}")
+
+        return self._get_fallback_rates(base_currency)
+
+    def _get_fallback_rates(self, base_currency: str) -> Dict[str, float]:
         """Fallback exchange rates when APIs are unavailable"""
-        return {
-            "USD": 1.0, "EUR": 0.85, "GBP": 0.73, "JPY": 110.0,
-            "AUD": 1.35, "CAD": 1.25, "CHF": 0.92, "CNY": 6.45,
-            "ZAR": 15.5, "INR": 74.5, "BRL": 5.2, "RUB": 73.5,
-            "KRW": 1180.0, "SGD": 1.35, "HKD": 7.8, "MXN": 20.5,
-            "SEK": 8.6, "NOK": 8.9, "DKK": 6.4, "PLN": 3.9,
-            "TRY": 8.5, "CZK": 22.0, "HUF": 300.0, "RON": 4.2
-        }
+        base_currency = _normalize_code(base_currency)
+        if base_currency not in _FALLBACK_RATES:
+            raise Exception(
+                f"All APIs failed and no fallback rates are available for {base_currency}"
+            )
+        logger.error("All APIs failed, using fallback rates")
+        return dict(_rebased_fallback_rates(base_currency))
+
+# Bumped whenever init_database gains a one-time data migration
+_SCHEMA_VERSION = 1
+
+# Write-behind settings for conversion history
+_FLUSH_INTERVAL = 0.2  # seconds
+_FLUSH_BATCH_SIZE = 500
+
+# Hot-path SQL, kept as constants so the connection's statement cache
+# reuses the prepared statements across calls
+_SQL_INSERT_RATE = '''
+    INSERT INTO exchange_rates 
+    (base_currency, target_currency, rate, timestamp)
+    VALUES (?, ?, ?, ?)
+    ON CONFLICT(base_currency, target_currency) DO UPDATE SET
+        rate = excluded.rate,
+        timestamp = excluded.timestamp
+'''
+
+_SQL_GET_RATE = '''
+    SELECT rate FROM exchange_rates 
+    WHERE base_currency = ? AND target_currency = ? 
+    AND timestamp > ?
+'''
+
+_SQL_HAS_FRESH = '''
+    SELECT EXISTS(
+        SELECT 1 FROM exchange_rates 
+        WHERE base_currency = ? AND timestamp > ?
+    )
+'''
+
+_SQL_SAVE_CONV = '''
+    INSERT INTO conversion_history 
+    (from_currency, to_currency, amount, converted_amount, exchange_rate, timestamp)
+    VALUES (?, ?, ?, ?, ?, ?)
+'''
+
+_SQL_HISTORY = '''
+    SELECT from_currency, to_currency, amount, converted_amount, 
+           exchange_rate, timestamp
+    FROM conversion_history 
+    ORDER BY timestamp DESC LIMIT ?
+'''
 
 class DatabaseManager:
     """Manages local SQLite database for caching and history"""
 
     def __init__(self, db_path: str = "currency_data.db"):
         self.db_path = db_path
+        # A single long-lived connection shared across threads; the lock
+        # serializes access since sqlite3 connections are not thread-safe
+        self._lock = threading.Lock()
+        self.conn = self._connect()
         self.init_database()
+        # Per-instance memo of rate lookups, keyed by (from, to, minute bucket)
+        self._lookup = functools.lru_cache(maxsize=256)(self._query_rate)
+
+        # History rows are written behind by a background thread in batches.
+        # The thread and the shutdown hook only see the shared state, never
+        # self, so an unclosed manager can still be garbage collected
+        self._wq = queue.Queue()
+        self._wq_lock = threading.Lock()
+        self._wake = threading.Event()
+        self._closed = threading.Event()
+        threading.Thread(
+            target=self._flush_loop,
+            args=(self.conn, self._lock, self._wq, self._wake, self._closed),
+            daemon=True
+        ).start()
+        # Flushes queued rows on close(), garbage collection or interpreter
+        # exit, whichever comes first
+        self._finalizer = weakref.finalize(
+            self, self._shutdown,
+            self.conn, self._lock, self._wq, self._wq_lock, self._wake, self._closed
+        )
+
+    def __enter__(self):
+        return self
+
+    def __exit__(self, exc_type, exc_value, traceback):
+        self.close()
+
+    def _connect(self) -> sqlite3.Connection:
+        """Open a connection with performance-oriented pragmas applied"""
+        conn = sqlite3.connect(self.db_path, check_same_thread=False,
+                               cached_statements=256)
+        # Autocommit mode: transactions are opened explicitly where needed
+        conn.isolation_level = None
+        conn.executescript('''
+            PRAGMA synchronous = NORMAL;
+            PRAGMA temp_store = MEMORY;
+            PRAGMA cache_size = -64000;
+            PRAGMA mmap_size = 30000000000;
+        ''')
+        return conn
+
+    def close(self):
+        """Flush pending writes and close the underlying database connection"""
+        self._finalizer()
+
+    def flush(self):
+        """Block until all queued history rows have been written"""
+        # Wake the writer rather than waiting for its next tick
+        self._wake.set()
+        self._wq.join()
+
+    @staticmethod
+    def _shutdown(conn, lock, wq, wq_lock, wake, closed):
+        """Stop accepting rows, drain the queue and close the connection"""
+        with wq_lock:
+            closed.set()
+        wake.set()
+        wq.join()
+        with lock:
+            conn.close()
+
+    @staticmethod
+    def _flush_loop(conn, lock, wq, wake, closed):
+        """Drain queued history rows every flush interval or when woken"""
+        while True:
+            wake.wait(_FLUSH_INTERVAL)
+            wake.clear()
+            # Check before draining: no rows can be queued once closed is set
+            closing = closed.is_set()
+            while DatabaseManager._write_batch(conn, lock, wq):
+                pass
+            if closing:
+                break
+
+    @staticmethod
+    def _write_batch(conn, lock, wq) -> bool:
+        """Write up to one batch of queued history rows; False if none"""
+        batch = []
+        try:
+            while len(batch) < _FLUSH_BATCH_SIZE:
+                batch.append(wq.get_nowait())
+        except queue.Empty:
+            pass
+        if not batch:
+            return False
+        try:
+            with lock:
+                cursor = conn.cursor()
+                cursor.execute("BEGIN IMMEDIATE")
+                try:
+                    cursor.executemany(_SQL_SAVE_CONV, batch)
+                except Exception:
+                    cursor.execute("ROLLBACK")
+                    raise
+                cursor.execute("COMMIT")
+        except Exception as e:
+            logger.error(f"Failed to save {len(batch)} conversions: {e}")
+        finally:
+            for _ in batch:
+                wq.task_done()
+        return True
 
     def init_database(self):
         """Initialize database tables"""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-
-            # Exchange rates cache table
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS exchange_rates (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    base_currency TEXT NOT NULL,
-                    target_currency TEXT NOT NULL,
-                    rate REAL NOT NULL,
-                    timestamp DATETIME NOT NULL,
-                    source TEXT DEFAULT 'API'
-                )
-            ''')
-
-            # Conversion history table
-            cursor.execute('''
-                CREATE TABLE IF NOT EXISTS conversion_history (
-                    id INTEGER PRIMARY KEY AUTOINCREMENT,
-                    from_currency TEXT NOT NULL,
-                    to_currency TEXT NOT NULL,
-                    amount REAL NOT NULL,
-                    converted_amount REAL NOT NULL,
-                    exchange_rate REAL NOT NULL,
-                    timestamp DATETIME DEFAULT CURRENT_TIMESTAMP
-                )
-            ''')
+        with self._lock:
+            cursor = self.conn.cursor()
 
-            # Indexes for faster queries
-            cursor.execute('''
-                CREATE INDEX IF NOT EXISTS idx_exchange_rates_currencies 
-                ON exchange_rates(base_currency, target_currency)
-            ''')
-
-            conn.commit()
+            # WAL mode is persistent, so it only needs to be set once
+            cursor.execute("PRAGMA journal_mode = WAL")
+            cursor.execute("BEGIN IMMEDIATE")
+            try:
+                # Tables use plain INTEGER PRIMARY KEY (a ROWID alias) to avoid
+                # sqlite_sequence bookkeeping. Databases created by older versions
+                # keep AUTOINCREMENT; delete currency_data.db (or copy the rows into
+                # freshly created tables) once to migrate.
+
+                # The rates table only holds a cache, so a table from before the
+                # one-row-per-pair constraint or integer timestamps is simply rebuilt
+                cursor.execute("PRAGMA table_info(exchange_rates)")
+                columns = {col[1]: col[2] for col in cursor.fetchall()}
+                cursor.execute("PRAGMA index_list(exchange_rates)")
+                has_unique = any(idx[2] and idx[3] == "u" for idx in cursor.fetchall())
+                if columns and (columns.get("timestamp") != "INTEGER" or not has_unique):
+                    cursor.execute("DROP TABLE exchange_rates")
+
+                # Exchange rates cache table, one row per currency pair
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS exchange_rates (
+                        id INTEGER PRIMARY KEY,
+                        base_currency TEXT NOT NULL,
+                        target_currency TEXT NOT NULL,
+                        rate REAL NOT NULL,
+                        timestamp INTEGER NOT NULL,
+                        source TEXT DEFAULT 'API',
+                        UNIQUE(base_currency, target_currency)
+                    )
+                ''')
+
+                # Conversion history table
+                cursor.execute('''
+                    CREATE TABLE IF NOT EXISTS conversion_history (
+                        id INTEGER PRIMARY KEY,
+                        from_currency TEXT NOT NULL,
+                        to_currency TEXT NOT NULL,
+                        amount REAL NOT NULL,
+                        converted_amount REAL NOT NULL,
+                        exchange_rate REAL NOT NULL,
+                        timestamp INTEGER NOT NULL
+                    )
+                ''')
+
+                # One-time migration: timestamps are stored as epoch seconds, so
+                # convert history rows written by older versions as UTC strings
+                cursor.execute("PRAGMA user_version")
+                if cursor.fetchone()[0] < _SCHEMA_VERSION:
+                    cursor.execute('''
+                        SELECT COUNT(*) FROM conversion_history
+                        WHERE typeof(timestamp) = 'text'
+                        AND strftime('%s', timestamp) IS NULL
+                    ''')
+                    bad_rows = cursor.fetchone()[0]
+                    if bad_rows:
+                        # History is display-only, so keep the rows but date
+                        # them at the epoch rather than blocking startup
+                        logger.warning(
+                            f"Resetting {bad_rows} history rows with invalid timestamps"
+                        )
+                    cursor.execute('''
+                        UPDATE conversion_history
+                        SET timestamp = COALESCE(
+                            CAST(strftime('%s', timestamp) AS INTEGER), 0
+                        )
+                        WHERE typeof(timestamp) = 'text'
+                    ''')
+                    cursor.execute(f"PRAGMA user_version = {_SCHEMA_VERSION}")
+
+                # The UNIQUE(base_currency, target_currency) index serves rate
+                # lookups, so older secondary indexes are only extra write cost
+                cursor.execute("DROP INDEX IF EXISTS idx_exchange_rates_currencies")
+                cursor.execute("DROP INDEX IF EXISTS idx_rates_lookup")
+            except Exception:
+                cursor.execute("ROLLBACK")
+                raise
+            cursor.execute("COMMIT")
             logger.info("Database initialized successfully")
 
     def cache_exchange_rates(self, base_currency: str, rates: Dict[str, float]):
         """Cache exchange rates in database"""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            timestamp = datetime.now()
-
-            # Clear old rates
-            one_hour_ago = timestamp - timedelta(hours=1)
-            cursor.execute('''
-                DELETE FROM exchange_rates 
-                WHERE base_currency = ? AND timestamp < ?
-            ''', (base_currency, one_hour_ago))
-
-            # Insert new rates
-            for currency, rate in rates.items():
-                cursor.execute('''
-                    INSERT INTO exchange_rates 
-                    (base_currency, target_currency, rate, timestamp)
-                    VALUES (?, ?, ?, ?)
-                ''', (base_currency, currency, rate, timestamp))
-
-            conn.commit()
+        base_currency = _normalize_code(base_currency)
+        with self._lock:
+            cursor = self.conn.cursor()
+            timestamp = int(time.time())
+
+            # Upsert new rates in a single batch, overwriting each pair in place
+            rows = [(base_currency, currency, rate, timestamp)
+                    for currency, rate in rates.items()]
+            cursor.execute("BEGIN IMMEDIATE")
+            try:
+                cursor.executemany(_SQL_INSERT_RATE, rows)
+            except Exception:
+                cursor.execute("ROLLBACK")
+                raise
+            cursor.execute("COMMIT")
             logger.info(f"Cached {len(rates)} exchange rates for {base_currency}")
 
+        # Drop memoized lookups so fresh rates are visible immediately
+        self._lookup.cache_clear()
+
     def get_cached_rate(self, from_currency: str, to_currency: str) -> Optional[float]:
         """Get cached exchange rate if still valid (within 1 hour)"""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            one_hour_ago = datetime.now() - timedelta(hours=1)
+        # Canonicalize codes so "usd" and "USD" share cache entries
+        from_currency = _normalize_code(from_currency)
+        to_currency = _normalize_code(to_currency)
+        # Repeat lookups within the same minute skip SQLite entirely
+        return self._lookup(from_currency, to_currency, int(time.time() // 60))
 
-            cursor.execute('''
-                SELECT rate FROM exchange_rates 
-                WHERE base_currency = ? AND target_currency = ? 
-                AND timestamp > ?
-                ORDER BY timestamp DESC LIMIT 1
-            ''', (from_currency, to_currency, one_hour_ago))
+    def _query_rate(self, from_currency: str, to_currency: str,
+                    bucket: int) -> Optional[float]:
+        """Query the rates table; memoized per minute bucket"""
+        with self._lock:
+            cursor = self.conn.cursor()
+            one_hour_ago = int(time.time()) - 3600
+
+            cursor.execute(_SQL_GET_RATE, (from_currency, to_currency, one_hour_ago))
 
             result = cursor.fetchone()
             return result[0] if result else None
 
+    def has_fresh_rates(self, base_currency: str) -> bool:
+        """Check whether any rates for base_currency are still valid"""
+        base_currency = _normalize_code(base_currency)
+        with self._lock:
+            cursor = self.conn.cursor()
+            one_hour_ago = int(time.time()) - 3600
+            cursor.execute(_SQL_HAS_FRESH, (base_currency, one_hour_ago))
+            return bool(cursor.fetchone()[0])
+
     def save_conversion(self, from_currency: str, to_currency: str,
                        amount: float, converted_amount: float, rate: float):
-        """Save conversion to history"""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute('''
-                INSERT INTO conversion_history 
-                (from_currency, to_currency, amount, converted_amount, exchange_rate)
-                VALUES (?, ?, ?, ?, ?)
-            ''', (from_currency, to_currency, amount, converted_amount, rate))
-            conn.commit()
+        """Queue conversion to be saved to history"""
+        with self._wq_lock:
+            if self._closed.is_set():
+                raise sqlite3.ProgrammingError("Cannot operate on a closed database.")
+            self._wq.put((from_currency, to_currency, amount, converted_amount, rate,
+                          int(time.time())))
 
     def get_conversion_history(self, limit: int = 20) -> List[Tuple]:
         """Get recent conversion history"""
-        with sqlite3.connect(self.db_path) as conn:
-            cursor = conn.cursor()
-            cursor.execute('''
-                SELECT from_currency, to_currency, amount, converted_amount, 
-                       exchange_rate, timestamp
-                FROM conversion_history 
-                ORDER BY timestamp DESC LIMIT ?
-            ''', (limit,))
-            return cursor.fetchall()
+        # Make sure queued conversions are visible
+        self.flush()
+        with self._lock:
+            cursor = self.conn.cursor()
+            cursor.execute(_SQL_HISTORY, (limit,))
+            # Convert epoch seconds back to datetimes for display
+            return [row[:5] + (datetime.fromtimestamp(row[5]),)
+                    for row in cursor.fetchall()]
+
+class DebouncedCallback:
+    """Coalesces bursts of tkinter events into a single delayed callback
+
+    Bind an instance to an entry's ``<KeyRelease>`` event so a conversion
+    runs once per typing burst instead of on every keystroke.
+    """
+
+    def __init__(self, root: tk.Misc, callback, delay_ms: int = 150):
+        self.root = root
+        self.callback = callback
+        self.delay_ms = delay_ms
+        self._pending_after = None
+
+    def __call__(self, event=None):
+        self.cancel()
+        self._pending_after = self.root.after(self.delay_ms, self._fire)
+
+    def cancel(self):
+        """Cancel the pending callback, if any"""
+        if self._pending_after:
+            self.root.after_cancel(self._pending_after)
+            self._pending_after = None
+
+    def _fire(self):
+        self._pending_after = None
+        self.callback()
 
 # --- CurrencyConverter, GUI, CLI classes stay unchanged except small fixes ---
 # (Too long to paste in this single block — I’ll continue in the next message)